@@ -6,34 +6,35 @@ digital content and interactions for alignment with unity consciousness.
 """
 
 from love_is_the_key import get_unity_report
-import json
 
 
 def print_report(title: str, text: str):
     """Helper function to print a formatted report."""
-    print(f"\n{'='*70}")
-    print(f"ANALYSIS: {title}")
-    print(f"{'='*70}")
-    print(f"\nInput Text:\n\"{text}\"")
-    
     report = get_unity_report(text)
     
-    print(f"\n--- Unity Coefficient Report ---")
-    print(f"Coefficient: {report.coefficient}")
-    print(f"Analysis Method: {report.analysis_method}")
-    print(f"\nSeparation Markers Found: {len(report.separation_hits)}")
-    for marker, count in report.separation_hits.items():
-        print(f"  - {marker}: {count}")
+    # Collect the whole report and write it with a single print call
+    lines = [
+        f"\n{'='*70}",
+        f"ANALYSIS: {title}",
+        f"{'='*70}",
+        f"\nInput Text:\n\"{text}\"",
+        f"\n--- Unity Coefficient Report ---",
+        f"Coefficient: {report.coefficient}",
+        f"Analysis Method: {report.analysis_method}",
+        f"\nSeparation Markers Found: {len(report.separation_hits)}",
+    ]
+    lines.extend(f"  - {marker}: {count}" for marker, count in report.separation_hits.items())
+    
+    lines.append(f"\nUnity Markers Found: {len(report.unity_hits)}")
+    lines.extend(f"  - {marker}: {count}" for marker, count in report.unity_hits.items())
     
-    print(f"\nUnity Markers Found: {len(report.unity_hits)}")
-    for marker, count in report.unity_hits.items():
-        print(f"  - {marker}: {count}")
+    lines.append(f"\nConscious Reframing:")
+    lines.append(f"  {report.conscious_reframing}")
     
-    print(f"\nConscious Reframing:")
-    print(f"  {report.conscious_reframing}")
+    lines.append(f"\n--- JSON Output (for LLM/API integration) ---")
+    lines.append(report.model_dump_json(indent=2))
     
-    print(f"\n--- JSON Output (for LLM/API integration) ---")
-    print(json.dumps(report.model_dump(), indent=2))
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
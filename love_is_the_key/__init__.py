@@ -10,8 +10,12 @@ abstract spiritual concepts into tangible, measurable metrics for AI systems.
 """
 
 from .models import UnityReport
-from .protocol import get_unity_report
+from .protocol import get_unity_report, get_unity_coefficient
 
 __version__ = "1.0.0"
-__all__ = ["UnityReport", "get_unity_report"]
+__all__ = [
+    "UnityReport",
+    "get_unity_report",
+    "get_unity_coefficient",
+]
 
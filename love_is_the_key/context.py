@@ -15,9 +15,13 @@ The goal is to provide awareness of consciousness patterns while honoring
 creative expression, artistic license, and human sovereignty.
 """
 
-from typing import Dict, List, Optional, Any
+import sys
+from typing import Dict, FrozenSet, List, Optional, Any, Sequence, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from .scanner import KeywordScanner, MAX_CACHED_TEXT_LENGTH, SCAN_CACHE_SIZE
 
 
 class ContentType(Enum):
@@ -36,7 +40,31 @@ class ContentType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Content types and genres where creative/artistic freedom applies
+_CREATIVE_TYPES = frozenset({
+    ContentType.FICTION,
+    ContentType.HORROR,
+    ContentType.COMEDY,
+    ContentType.SATIRE,
+    ContentType.ARTISTIC
+})
+_CREATIVE_GENRES = frozenset({"horror", "comedy", "satire"})
+
+# Content types that can carry a more specific genre
+_GENRE_TYPES = frozenset({ContentType.FICTION, ContentType.ARTISTIC})
+
+# Content types whose intent is artistic
+_ARTISTIC_TYPES = frozenset({ContentType.FICTION, ContentType.ARTISTIC, ContentType.HORROR})
+
+# Non-creative content types where reframing is offered below the balanced threshold
+_REFRAMING_TYPES = frozenset({ContentType.BUSINESS, ContentType.TECHNICAL})
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ContentContext:
     """
     Represents the detected context of content being analyzed.
@@ -56,11 +84,22 @@ class ContentContext:
     audience: Optional[str] = None
     creative_license: bool = False
     confidence: float = 0.0
-    metadata: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+# Detected (content_type, genre, intent, creative_license, confidence)
+_DetectedFields = Tuple[ContentType, Optional[str], Optional[str], bool, float]
+
+
+def _indicator_slots(
+    scored_indicators: Sequence[Tuple[ContentType, Sequence[str]]]
+) -> Dict[str, Tuple[int, ...]]:
+    """Map each indicator to the positions of the lexicons that contain it."""
+    slots: Dict[str, List[int]] = {}
+    for slot, (_, indicators) in enumerate(scored_indicators):
+        for indicator in indicators:
+            slots.setdefault(indicator, []).append(slot)
+    return {indicator: tuple(entries) for indicator, entries in slots.items()}
 
 
 class ContextDetector:
@@ -73,40 +112,67 @@ class ContextDetector:
     """
     
     # Fiction indicators
-    FICTION_INDICATORS = [
+    FICTION_INDICATORS = (
         "chapter", "protagonist", "character", "plot", "story", "novel",
         "narrative", "scene", "dialogue", "narrator", "fiction"
-    ]
+    )
     
     # Horror genre indicators
-    HORROR_INDICATORS = [
+    HORROR_INDICATORS = (
         "horror", "terror", "fear", "scream", "blood", "death", "monster",
         "nightmare", "haunted", "ghost", "zombie", "vampire", "demon"
-    ]
+    )
     
     # Comedy/Satire indicators
-    COMEDY_INDICATORS = [
+    COMEDY_INDICATORS = (
         "comedy", "humor", "joke", "funny", "satire", "parody", "irony",
         "sarcasm", "wit", "amusing", "hilarious", "laugh"
-    ]
+    )
     
     # Technical indicators
-    TECHNICAL_INDICATORS = [
+    TECHNICAL_INDICATORS = (
         "function", "class", "method", "algorithm", "implementation",
         "documentation", "api", "code", "syntax", "compile", "debug"
-    ]
+    )
     
     # Academic indicators
-    ACADEMIC_INDICATORS = [
+    ACADEMIC_INDICATORS = (
         "abstract", "methodology", "hypothesis", "research", "study",
         "analysis", "conclusion", "bibliography", "citation", "peer-reviewed"
-    ]
+    )
     
     # Artistic indicators
-    ARTISTIC_INDICATORS = [
+    ARTISTIC_INDICATORS = (
         "artistic", "creative", "expression", "art", "poetry", "prose",
         "metaphor", "symbolism", "imagery", "aesthetic"
-    ]
+    )
+    
+    # The lexicons above are immutable tuples because they are compiled into
+    # the scanner when the class is created; later edits would never be seen.
+    # Subclasses may override any lexicon and get their own compiled scanner.
+    _SCORED_INDICATORS: Tuple[Tuple[ContentType, Sequence[str]], ...]
+    _INDICATOR_SLOTS: Dict[str, Tuple[int, ...]]
+    _SCANNER: Optional[KeywordScanner]
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compile_indicators()
+    
+    @classmethod
+    def _compile_indicators(cls) -> None:
+        """Compile this class's lexicons so a single scan scores every type."""
+        # Content types scored during detection, with their indicator lexicons
+        cls._SCORED_INDICATORS = (
+            (ContentType.FICTION, cls.FICTION_INDICATORS),
+            (ContentType.HORROR, cls.HORROR_INDICATORS),
+            (ContentType.COMEDY, cls.COMEDY_INDICATORS),
+            (ContentType.TECHNICAL, cls.TECHNICAL_INDICATORS),
+            (ContentType.ACADEMIC, cls.ACADEMIC_INDICATORS),
+            (ContentType.ARTISTIC, cls.ARTISTIC_INDICATORS),
+        )
+        cls._INDICATOR_SLOTS = _indicator_slots(cls._SCORED_INDICATORS)
+        # A subclass may empty every lexicon; there is then nothing to scan for
+        cls._SCANNER = KeywordScanner(cls._INDICATOR_SLOTS) if cls._INDICATOR_SLOTS else None
     
     def detect(self, text: str, user_context: Optional[Dict] = None) -> ContentContext:
         """
@@ -119,17 +185,18 @@ class ContextDetector:
         Returns:
             ContentContext with detected information
         """
-        text_lower = text.lower()
-        
         # If user explicitly provides context, trust it
         if user_context:
             return self._build_from_user_context(user_context)
         
-        # Detect content type through pattern matching
-        content_type, confidence = self._detect_content_type(text_lower)
-        genre = self._detect_genre(text_lower, content_type)
-        intent = self._detect_intent(text_lower, content_type)
-        creative_license = self._has_creative_license(content_type, genre)
+        # The base detector's result depends only on the text, so repeated
+        # short texts hit the cache. Subclasses may change detection or hold
+        # state, so they always run their own detection.
+        if type(self) is ContextDetector and len(text) <= MAX_CACHED_TEXT_LENGTH:
+            fields = _cached_detection(text)
+        else:
+            fields = self._detect_fields(text)
+        content_type, genre, intent, creative_license, confidence = fields
         
         return ContentContext(
             content_type=content_type,
@@ -139,59 +206,68 @@ class ContextDetector:
             confidence=confidence
         )
     
-    def _detect_content_type(self, text: str) -> tuple[ContentType, float]:
-        """Detect the primary content type with confidence score."""
-        scores = {}
+    def _detect_fields(self, text: str) -> _DetectedFields:
+        """Run pattern detection on the text and return the detected fields."""
+        if self._SCANNER is None:
+            return ContentType.UNKNOWN, None, None, False, 0.0
         
-        # Calculate scores for each type
-        scores[ContentType.FICTION] = self._calculate_indicator_score(
-            text, self.FICTION_INDICATORS
-        )
-        scores[ContentType.HORROR] = self._calculate_indicator_score(
-            text, self.HORROR_INDICATORS
-        )
-        scores[ContentType.COMEDY] = self._calculate_indicator_score(
-            text, self.COMEDY_INDICATORS
-        )
-        scores[ContentType.TECHNICAL] = self._calculate_indicator_score(
-            text, self.TECHNICAL_INDICATORS
-        )
-        scores[ContentType.ACADEMIC] = self._calculate_indicator_score(
-            text, self.ACADEMIC_INDICATORS
-        )
-        scores[ContentType.ARTISTIC] = self._calculate_indicator_score(
-            text, self.ARTISTIC_INDICATORS
-        )
+        # The lowered copy is only needed for the single scan below
+        indicators_found = self._SCANNER.present(text.lower())
+        content_type, confidence, scores = self._detect_content_type(indicators_found)
+        genre = self._detect_genre(content_type, scores)
+        intent = self._detect_intent(content_type)
+        creative_license = self._has_creative_license(content_type, genre)
         
-        # Find highest scoring type
-        if not scores or max(scores.values()) < 0.1:
-            return ContentType.UNKNOWN, 0.0
+        return content_type, genre, intent, creative_license, confidence
+    
+    def _detect_content_type(
+        self,
+        indicators_found: FrozenSet[str]
+    ) -> tuple[ContentType, float, Dict[ContentType, float]]:
+        """Detect the primary content type with confidence score and per-type scores."""
+        # fast-path: with no indicators found no type can reach the threshold
+        if not indicators_found:
+            return ContentType.UNKNOWN, 0.0, {}
         
-        best_type = max(scores, key=scores.get)
-        confidence = min(scores[best_type], 1.0)
+        matches = [0] * len(self._SCORED_INDICATORS)
+        for indicator in indicators_found:
+            for slot in self._INDICATOR_SLOTS[indicator]:
+                matches[slot] += 1
         
-        return best_type, confidence
-    
-    def _calculate_indicator_score(self, text: str, indicators: List[str]) -> float:
-        """Calculate how strongly the text matches a set of indicators."""
-        if not indicators:
-            return 0.0
+        # Normalise once per type rather than once per indicator; an empty
+        # lexicon scores 0.0
+        scores = {
+            content_type: count / len(indicators) if indicators else 0.0
+            for count, (content_type, indicators) in zip(matches, self._SCORED_INDICATORS)
+        }
+        
+        # Find highest scoring type in a single pass; ties keep the earlier type
+        best_type, best_score = ContentType.UNKNOWN, 0.0
+        for content_type, score in scores.items():
+            if score > best_score:
+                best_type, best_score = content_type, score
+        
+        if best_score < 0.1:
+            return ContentType.UNKNOWN, 0.0, scores
         
-        matches = sum(1 for indicator in indicators if indicator in text)
-        return matches / len(indicators)
+        return best_type, min(best_score, 1.0), scores
     
-    def _detect_genre(self, text: str, content_type: ContentType) -> Optional[str]:
-        """Detect specific genre within content type."""
-        if content_type in [ContentType.FICTION, ContentType.ARTISTIC]:
-            if any(indicator in text for indicator in self.HORROR_INDICATORS):
+    def _detect_genre(
+        self,
+        content_type: ContentType,
+        scores: Dict[ContentType, float]
+    ) -> Optional[str]:
+        """Detect specific genre within content type from the type scores."""
+        if content_type in _GENRE_TYPES:
+            if scores.get(ContentType.HORROR, 0.0) > 0:
                 return "horror"
-            if any(indicator in text for indicator in self.COMEDY_INDICATORS):
+            if scores.get(ContentType.COMEDY, 0.0) > 0:
                 return "comedy"
         return None
     
-    def _detect_intent(self, text: str, content_type: ContentType) -> Optional[str]:
+    def _detect_intent(self, content_type: ContentType) -> Optional[str]:
         """Detect the intent behind the content."""
-        if content_type in [ContentType.FICTION, ContentType.ARTISTIC, ContentType.HORROR]:
+        if content_type in _ARTISTIC_TYPES:
             return "artistic"
         elif content_type == ContentType.TECHNICAL:
             return "educational"
@@ -201,14 +277,7 @@ class ContextDetector:
     
     def _has_creative_license(self, content_type: ContentType, genre: Optional[str]) -> bool:
         """Determine if creative license should be respected."""
-        creative_types = [
-            ContentType.FICTION,
-            ContentType.HORROR,
-            ContentType.COMEDY,
-            ContentType.SATIRE,
-            ContentType.ARTISTIC
-        ]
-        return content_type in creative_types or genre in ["horror", "comedy", "satire"]
+        return content_type in _CREATIVE_TYPES or genre in _CREATIVE_GENRES
     
     def _build_from_user_context(self, user_context: Dict) -> ContentContext:
         """Build ContentContext from user-provided information."""
@@ -228,6 +297,22 @@ class ContextDetector:
         )
 
 
+ContextDetector._compile_indicators()
+
+
+@lru_cache(maxsize=SCAN_CACHE_SIZE)
+def _cached_detection(text: str) -> _DetectedFields:
+    """
+    Memoised pattern detection for the base ContextDetector.
+    
+    Only texts up to MAX_CACHED_TEXT_LENGTH characters are passed here;
+    longer texts are detected uncached so the cache cannot pin large
+    documents in memory. The cached value is an immutable tuple so every
+    caller still receives its own ContentContext instance.
+    """
+    return ContextDetector()._detect_fields(text)
+
+
 class ConsciousnessContextualizer:
     """
     Applies context intelligence to consciousness metrics.
@@ -333,13 +418,18 @@ class ConsciousnessContextualizer:
         if context.creative_license:
             return False
         
-        if context.content_type in [ContentType.BUSINESS, ContentType.TECHNICAL]:
+        if context.content_type in _REFRAMING_TYPES:
             return coefficient < 0.5
         
         # For other content, only suggest if very low
         return coefficient < 0.3
 
 
+# Both classes are stateless, so the convenience functions share one instance each
+_DEFAULT_DETECTOR = ContextDetector()
+_DEFAULT_CONTEXTUALIZER = ConsciousnessContextualizer()
+
+
 def detect_context(text: str, user_context: Optional[Dict] = None) -> ContentContext:
     """
     Convenience function to detect content context.
@@ -351,8 +441,7 @@ def detect_context(text: str, user_context: Optional[Dict] = None) -> ContentCon
     Returns:
         ContentContext with detected information
     """
-    detector = ContextDetector()
-    return detector.detect(text, user_context)
+    return _DEFAULT_DETECTOR.detect(text, user_context)
 
 
 def contextualize_analysis(
@@ -371,6 +460,5 @@ def contextualize_analysis(
     Returns:
         Dictionary with contextualized analysis
     """
-    contextualizer = ConsciousnessContextualizer()
-    return contextualizer.contextualize_coefficient(coefficient, text, user_context)
+    return _DEFAULT_CONTEXTUALIZER.contextualize_coefficient(coefficient, text, user_context)
 
@@ -9,7 +9,10 @@ the Unity Coefficient.
 
 from .models import UnityReport
 from .context import detect_context, contextualize_analysis, ContentContext
-from typing import List, Optional, Dict, Any
+from .scanner import KeywordScanner, MAX_CACHED_TEXT_LENGTH, SCAN_CACHE_SIZE
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 
 # --- The Core Lexicon (P3) ---
 # This is the most vital step: the philosophical foundation that gives
@@ -19,7 +22,7 @@ from typing import List, Optional, Dict, Any
 # These lists should be meticulously expanded to capture the full spectrum
 # of separation and unity consciousness in language.
 
-SEPARATION_MARKERS: List[str] = [
+SEPARATION_MARKERS = [
     # Core separation concepts
     "fear", "lack", "impossible", "us versus them", "judgement",
     "crisis", "scarcity", "division", "conflict", "enemy",
@@ -45,7 +48,7 @@ SEPARATION_MARKERS: List[str] = [
     "competition", "rivalry", "opponent", "adversary", "foe",
 ]
 
-UNITY_MARKERS: List[str] = [
+UNITY_MARKERS = [
     # Core unity concepts
     "love", "unity", "co-create", "abundance", "possibility",
     "solution", "harmony", "peace", "together", "collaboration",
@@ -83,65 +86,153 @@ UNITY_MARKERS: List[str] = [
 ]
 
 
-# --- V1 Implementation: Keyword Lexicon Adapter (P4) ---
+# Repeated entries are dropped once, keeping each marker at its first position.
+# The final lexicons are immutable tuples: they are compiled into the scanner
+# below, so later edits would silently never be seen.
+SEPARATION_MARKERS: Tuple[str, ...] = tuple(dict.fromkeys(SEPARATION_MARKERS))
+UNITY_MARKERS: Tuple[str, ...] = tuple(dict.fromkeys(UNITY_MARKERS))
 
-def v1_keyword_calculate(text: str) -> UnityReport:
+# Both lexicons are compiled into one scanner so a single pass counts every marker.
+# Matches are leftmost-longest and never overlap, so a marker embedded in a longer
+# one ("possible" in "impossible", "finite" in "infinite") is not counted twice.
+# Hits are reported in lexicon order.
+_MARKER_SCANNER = KeywordScanner(SEPARATION_MARKERS + UNITY_MARKERS)
+_MARKER_RANK = {marker: rank for rank, marker in enumerate(SEPARATION_MARKERS + UNITY_MARKERS)}
+_SEPARATION_SIZE = len(SEPARATION_MARKERS)
+
+# (marker, count) pairs in lexicon order
+_MarkerHits = Tuple[Tuple[str, int], ...]
+
+
+@dataclass(frozen=True)
+class _MarkerScan:
     """
-    V1 Protocol: Calculates Unity Coefficient based on simple keyword density.
+    Immutable outcome of scanning a text for markers.
     
-    This is the immediate utility for LLMs via fast, quantifiable metrics.
-    The algorithm counts occurrences of separation and unity markers in the text,
-    then calculates a coefficient representing the balance between them.
+    Being frozen, one instance can be cached and shared by every caller;
+    public results are built from it at the API boundary.
+    """
+    separation_hits: _MarkerHits
+    unity_hits: _MarkerHits
+    coefficient: float
+
+
+def _calculate_coefficient(separation_count: int, unity_count: int) -> float:
+    """Balance of unity over all markers found, with 0.5 as the neutral baseline."""
+    total_markers = separation_count + unity_count
+    if total_markers == 0:
+        return 0.5  # Neutral baseline
+    return unity_count / total_markers
+
+
+def _scan_markers(text: str) -> _MarkerScan:
+    """
+    Count separation and unity markers in the text.
+    
+    Scans of texts up to MAX_CACHED_TEXT_LENGTH characters are memoised
+    per text; longer texts are scanned uncached so the cache cannot pin
+    large documents in memory.
+    """
+    if len(text) <= MAX_CACHED_TEXT_LENGTH:
+        return _cached_count_markers(text)
+    return _count_markers(text)
+
+
+def _count_markers(text: str) -> _MarkerScan:
+    """Count separation and unity markers in the text with one scan."""
+    marker_counts = _MARKER_SCANNER.count_longest(text.lower())
+    
+    # One sort by rank orders both lexicons; separation markers rank first
+    hits = sorted(marker_counts.items(), key=lambda hit: _MARKER_RANK[hit[0]])
+    split = 0
+    separation_count = 0
+    for marker, count in hits:
+        if _MARKER_RANK[marker] >= _SEPARATION_SIZE:
+            break
+        split += 1
+        separation_count += count
+    
+    unity_count = sum(marker_counts.values()) - separation_count
+    return _MarkerScan(
+        separation_hits=tuple(hits[:split]),
+        unity_hits=tuple(hits[split:]),
+        coefficient=_calculate_coefficient(separation_count, unity_count)
+    )
+
+
+_cached_count_markers = lru_cache(maxsize=SCAN_CACHE_SIZE)(_count_markers)
+
+
+# --- V1 Implementation: Keyword Lexicon Adapter (P4) ---
+
+_V1_ANALYSIS_METHOD = "V1: Keyword Lexicon Density"
+
+# Conscious reframing for each coefficient threshold
+_REFRAME_HIGH = "High Unity Alignment. The intent is rooted in love and abundance."
+_REFRAME_BALANCED = "Balanced Alignment. The potential for conscious co-creation is strong, requiring only slight reframing."
+_REFRAME_LOW = "The content leans towards separation logic. Re-evaluate the core premise from the perspective of our shared source and inherent abundance."
+
+
+def _v1_analyze(text: str) -> Tuple[float, Dict[str, int], Dict[str, int], str]:
+    """
+    Run the V1 keyword-density algorithm and return its raw results.
     
     Args:
-        text: The input text to analyze (can be content, code comments, policies, etc.)
+        text: The input text to analyze
         
     Returns:
-        UnityReport: A structured report containing the coefficient and detailed analysis
+        (rounded coefficient, separation hits, unity hits, reframing), so that
+        callers can build exactly one UnityReport with any extra fields.
         
     Algorithm:
         1. Convert text to lowercase for case-insensitive matching
-        2. Count occurrences of each marker in both lexicons
+        2. Count markers from both lexicons in a single scan; each character
+           counts towards at most one (the longest) marker
         3. Calculate coefficient: unity_count / (unity_count + separation_count)
         4. Generate conscious reframing based on coefficient thresholds
     """
-    text_lower = text.lower()
-    separation_hits = {}
-    unity_hits = {}
-    
-    # 1. Count Markers
-    for marker in SEPARATION_MARKERS:
-        count = text_lower.count(marker)
-        if count > 0:
-            separation_hits[marker] = count
-    
-    for marker in UNITY_MARKERS:
-        count = text_lower.count(marker)
-        if count > 0:
-            unity_hits[marker] = count
-    
-    separation_count = sum(separation_hits.values())
-    unity_count = sum(unity_hits.values())
-    total_markers = separation_count + unity_count
+    # 1-3. Count Markers and Calculate Coefficient (one scan, cached for short texts)
+    scan = _scan_markers(text)
+    coefficient = scan.coefficient
     
-    # 2. Calculate Coefficient
-    if total_markers == 0:
-        coefficient = 0.5  # Neutral baseline
-    else:
-        coefficient = unity_count / total_markers
-    
-    # 3. Conscious Reframing Logic
+    # 4. Conscious Reframing Logic
     if coefficient >= 0.75:
-        reframing = "High Unity Alignment. The intent is rooted in love and abundance."
+        reframing = _REFRAME_HIGH
     elif coefficient >= 0.5:
-        reframing = "Balanced Alignment. The potential for conscious co-creation is strong, requiring only slight reframing."
+        reframing = _REFRAME_BALANCED
     else:
         # **PLACEHOLDER 2: REFRAMING ALGORITHM** - Future development point
-        reframing = "The content leans towards separation logic. Re-evaluate the core premise from the perspective of our shared source and inherent abundance."
+        reframing = _REFRAME_LOW
+    
+    return (
+        round(coefficient, 4),
+        dict(scan.separation_hits),
+        dict(scan.unity_hits),
+        reframing
+    )
+
+
+def v1_keyword_calculate(text: str) -> UnityReport:
+    """
+    V1 Protocol: Calculates Unity Coefficient based on simple keyword density.
     
-    return UnityReport(
-        coefficient=round(coefficient, 4),
-        analysis_method="V1: Keyword Lexicon Density",
+    This is the immediate utility for LLMs via fast, quantifiable metrics.
+    It wraps _v1_analyze, which counts occurrences of separation and unity
+    markers in the text and calculates a coefficient representing the
+    balance between them, and packages the results as a report.
+    
+    Args:
+        text: The input text to analyze (can be content, code comments, policies, etc.)
+        
+    Returns:
+        UnityReport: A structured report containing the coefficient and detailed analysis
+    """
+    coefficient, separation_hits, unity_hits, reframing = _v1_analyze(text)
+    
+    # Every field is computed here and always valid, so validation is skipped
+    return UnityReport.model_construct(
+        coefficient=coefficient,
+        analysis_method=_V1_ANALYSIS_METHOD,
         separation_hits=separation_hits,
         unity_hits=unity_hits,
         conscious_reframing=reframing
@@ -183,34 +274,48 @@ def get_unity_report(
         Embeddings) is built, the logic here will dynamically switch to the more
         advanced adapter based on configuration.
     """
-    # Get base unity coefficient using V1 algorithm
-    base_report = v1_keyword_calculate(text)
-    
-    # If context awareness is disabled, return base report
+    # If context awareness is disabled, return the base V1 report
     if not include_context:
-        return base_report
+        return v1_keyword_calculate(text)
+    
+    # Get base unity coefficient using V1 algorithm
+    coefficient, separation_hits, unity_hits, reframing = _v1_analyze(text)
     
     # Add context intelligence
     context_data = contextualize_analysis(
-        coefficient=base_report.coefficient,
+        coefficient=coefficient,
         text=text,
         user_context=user_context
     )
     
-    # Enhance the report with contextual information
-    enhanced_report = UnityReport(
-        coefficient=base_report.coefficient,
-        analysis_method=base_report.analysis_method,
-        separation_hits=base_report.separation_hits,
-        unity_hits=base_report.unity_hits,
-        conscious_reframing=_generate_context_aware_reframing(
-            base_report.conscious_reframing,
-            context_data
-        ),
+    # Build the context-aware report once; every field is internally
+    # computed, so validation is skipped
+    return UnityReport.model_construct(
+        coefficient=coefficient,
+        analysis_method=_V1_ANALYSIS_METHOD,
+        separation_hits=separation_hits,
+        unity_hits=unity_hits,
+        conscious_reframing=_generate_context_aware_reframing(reframing, context_data),
         context_info=context_data
     )
+
+
+def get_unity_coefficient(text: str) -> float:
+    """
+    Lean entry point returning only the Unity Coefficient.
     
-    return enhanced_report
+    For gates, filters and logging that need the number alone: the same
+    markers are counted as in get_unity_report, but no hit dictionaries,
+    reframing or context analysis are built.
+    
+    Args:
+        text: The input text to analyze
+        
+    Returns:
+        The Unity Coefficient (0.0=Separation, 1.0=Unity), rounded like
+        UnityReport.coefficient
+    """
+    return round(_scan_markers(text).coefficient, 4)
 
 
 def _generate_context_aware_reframing(
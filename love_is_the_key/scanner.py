@@ -0,0 +1,113 @@
+"""
+Multi-keyword scanning for the Love Protocol lexicons.
+
+The lexicons used across the package are static, so instead of searching the
+text once per keyword, every lexicon is compiled into a single trie-shaped
+regular expression at import time. One sweep of the compiled pattern then
+reports every keyword found in the text, keeping the per-character work inside
+the C regex engine rather than in Python-level loops.
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, Tuple
+
+
+# Scan results are memoised per text only for texts up to this many
+# characters. Long documents are rarely repeated, and caching them would keep
+# every one of them alive for the life of the process.
+MAX_CACHED_TEXT_LENGTH = 4096
+
+# Number of distinct texts each scan cache holds
+SCAN_CACHE_SIZE = 1024
+
+
+def _build_trie(keywords: Iterable[str]) -> Dict[str, Any]:
+    """Build a character trie; the empty-string key marks the end of a keyword."""
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = True
+    return trie
+
+
+def _trie_to_regex(node: Dict[str, Any]) -> str:
+    """
+    Render a trie node as a regex fragment.
+    
+    Branches are emitted before the end-of-keyword marker so that the regex
+    engine always prefers the longest keyword starting at a given position.
+    """
+    terminal = "" in node
+    branches = [
+        re.escape(char) + _trie_to_regex(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    fragment = "(?:" + "|".join(branches) + ")"
+    return fragment + "?" if terminal else fragment
+
+
+class KeywordScanner:
+    """
+    Finds keywords from a fixed lexicon in a single pass over the text.
+    
+    ``present`` follows plain substring semantics (the same as ``keyword in
+    text``), so keywords embedded in longer words are reported too, while
+    ``count_longest`` counts non-overlapping leftmost-longest matches.
+    
+    Attributes:
+        keywords: The distinct keywords this scanner recognises
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(keywords))
+        if not self.keywords:
+            raise ValueError("KeywordScanner requires at least one keyword")
+        if "" in self.keywords:
+            raise ValueError("KeywordScanner keywords must not be empty")
+        
+        # A zero-width lookahead lets the engine report a keyword at every
+        # position, including positions inside an earlier match. The leading
+        # first-character class rejects positions that cannot start any
+        # keyword before the trie is entered.
+        trie_regex = _trie_to_regex(_build_trie(self.keywords))
+        first_chars = "".join(sorted({keyword[0] for keyword in self.keywords}))
+        self._pattern = re.compile(
+            "(?=[" + re.escape(first_chars) + "])(?=(" + trie_regex + "))"
+        )
+        
+        # Without the lookahead, the engine instead consumes the longest
+        # keyword at the leftmost position and resumes after it.
+        self._longest_pattern = re.compile(trie_regex)
+        
+        # The pattern reports only the longest keyword starting at each
+        # position; any shorter keyword starting there is a prefix of it.
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(k for k in self.keywords if keyword.startswith(k))
+            for keyword in self.keywords
+        }
+    
+    def present(self, text: str) -> FrozenSet[str]:
+        """Return the set of keywords that occur anywhere in ``text``."""
+        found = set()
+        for longest in set(self._pattern.findall(text)):
+            found.update(self._prefixes[longest])
+        return frozenset(found)
+    
+    def count_longest(self, text: str) -> Dict[str, int]:
+        """
+        Count keywords as non-overlapping, leftmost-longest matches.
+        
+        Each character of ``text`` contributes to at most one keyword, so a
+        keyword embedded in a longer one (``"possible"`` in ``"impossible"``)
+        is not counted a second time. Keywords that do not occur are omitted.
+        """
+        # Counter tallies the matched strings in C, one pass over the hit list
+        return Counter(self._longest_pattern.findall(text))
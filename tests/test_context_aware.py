@@ -5,8 +5,15 @@ These tests verify that the Love Protocol respects creative license
 and provides informative rather than restrictive analysis.
 """
 
+import sys
+
 import pytest
 from love_is_the_key import get_unity_report
+from love_is_the_key.context import (
+    ContentType,
+    ContextDetector,
+    detect_context,
+)
 
 
 def test_horror_fiction_creative_license():
@@ -159,6 +166,89 @@ def test_sovereignty_respected():
                "optional" in reframing_lower
 
 
+def test_repeated_detection_returns_independent_contexts():
+    """Test that cached detection still hands each caller its own context."""
+    text = "The haunted narrator screamed as the monster appeared."
+    
+    first = detect_context(text)
+    first.metadata["note"] = "edited by caller"
+    second = detect_context(text)
+    
+    assert first is not second
+    assert second.content_type == first.content_type
+    assert second.metadata == {}
+
+
+def test_subclass_lexicon_override():
+    """Test that a detector subclass can override an indicator lexicon."""
+    class InfraDetector(ContextDetector):
+        TECHNICAL_INDICATORS = ("kubernetes", "docker", "yaml")
+    
+    text = "deploy the kubernetes docker yaml"
+    
+    assert InfraDetector().detect(text).content_type == ContentType.TECHNICAL
+    assert detect_context(text).content_type == ContentType.UNKNOWN
+
+
+def test_subclass_empty_lexicon_scores_zero():
+    """Test that an emptied lexicon is scored as 0.0 instead of failing."""
+    class NoComedy(ContextDetector):
+        COMEDY_INDICATORS = ()
+    
+    context = NoComedy().detect("the protagonist in chapter one")
+    
+    assert context.content_type == ContentType.FICTION
+
+
+def test_subclass_without_indicators():
+    """Test that a detector with every lexicon emptied detects UNKNOWN."""
+    class NoIndicators(ContextDetector):
+        FICTION_INDICATORS = ()
+        HORROR_INDICATORS = ()
+        COMEDY_INDICATORS = ()
+        TECHNICAL_INDICATORS = ()
+        ACADEMIC_INDICATORS = ()
+        ARTISTIC_INDICATORS = ()
+    
+    context = NoIndicators().detect("the protagonist in chapter one")
+    
+    assert context.content_type == ContentType.UNKNOWN
+    assert context.creative_license is False
+    assert context.confidence == 0.0
+
+
+def test_subclass_with_constructor_arguments():
+    """Test that detection runs on the detector instance itself."""
+    class ThresholdDetector(ContextDetector):
+        def __init__(self, floor):
+            self.floor = floor
+        
+        def _detect_fields(self, text):
+            content_type, genre, intent, creative_license, confidence = \
+                super()._detect_fields(text)
+            return content_type, genre, intent, creative_license, max(confidence, self.floor)
+    
+    context = ThresholdDetector(0.9).detect("The haunted narrator screamed.")
+    
+    assert context.confidence == 0.9
+
+
+def test_long_document_detection():
+    """Test that a long chapter is detected fully and not held by the cache."""
+    chapter = (
+        "Chapter 12. The narrator crept through the haunted house, "
+        "where every scream told the ghost story again. "
+    ) * 100
+    references = sys.getrefcount(chapter)
+    
+    context = detect_context(chapter)
+    
+    assert context.content_type == ContentType.FICTION
+    assert context.genre == "horror"
+    assert context.creative_license is True
+    assert sys.getrefcount(chapter) == references
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
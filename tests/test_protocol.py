@@ -5,8 +5,15 @@ These tests verify the UCA logic works as intended for clear-cut examples,
 ensuring code reliability (≥95% certainty).
 """
 
+import gc
+import weakref
+
 import pytest
-from love_is_the_key import get_unity_report, UnityReport
+from love_is_the_key import (
+    get_unity_report,
+    get_unity_coefficient,
+    UnityReport,
+)
 
 
 class TestUnityReport:
@@ -65,7 +72,6 @@ class TestV1KeywordCalculate:
     
     def test_pure_separation_text(self):
         """Test text with only separation markers."""
-        # Note: "impossible" contains "possible" which is a unity marker
         text = "Fear and crisis dominate our world through lack and scarcity and conflict."
         report = get_unity_report(text)
         
@@ -116,6 +122,15 @@ class TestV1KeywordCalculate:
         assert report.separation_hits["fear"] == 1
         assert report.coefficient == 0.75  # 3 / (3 + 1)
     
+    def test_embedded_markers_not_double_counted(self):
+        """Test that a marker inside a longer marker is counted only once."""
+        text = "It is impossible to see the infinite."
+        report = get_unity_report(text)
+        
+        assert report.separation_hits == {"impossible": 1}
+        assert report.unity_hits == {"infinite": 1}
+        assert report.coefficient == 0.5
+    
     def test_high_unity_threshold(self):
         """Test the high unity threshold (>= 0.75)."""
         text = "love unity abundance"  # 3 unity markers, 0 separation
@@ -160,6 +175,32 @@ class TestGetUnityReport:
         assert len(report.separation_hits) == 0
         assert len(report.unity_hits) == 0
     
+    def test_repeated_text_returns_independent_reports(self):
+        """Test that cached analysis never shares hit dicts between reports."""
+        text = "love love fear"
+        first = get_unity_report(text)
+        first.unity_hits["love"] = 99
+        second = get_unity_report(text)
+        
+        assert second.unity_hits == {"love": 2}
+        assert second.coefficient == first.coefficient
+    
+    def test_long_text_is_not_retained(self):
+        """Test that a long document is analysed correctly and not kept alive."""
+        class Document(str):
+            """A str subclass, so the text can be weakly referenced."""
+        
+        text = Document("love and unity, not fear. " * 200)
+        text_ref = weakref.ref(text)
+        report = get_unity_report(text)
+        
+        assert report.unity_hits == {"love": 200, "unity": 200}
+        assert report.separation_hits == {"fear": 200}
+        
+        del text
+        gc.collect()
+        assert text_ref() is None
+    
     def test_json_serialization(self):
         """Test that the report can be serialized to JSON."""
         text = "love and unity"
@@ -170,3 +211,15 @@ class TestGetUnityReport:
         assert "coefficient" in json_str
         assert "analysis_method" in json_str
 
+
+class TestGetUnityCoefficient:
+    """Test the coefficient-only entry point."""
+    
+    def test_matches_report_coefficient(self):
+        """Test that the lean API agrees with the full report."""
+        for text in ["love love love fear", "fear crisis lack", "love fear", "", "It is impossible."]:
+            assert get_unity_coefficient(text) == get_unity_report(text).coefficient
+    
+    def test_neutral_baseline(self):
+        """Test that text without markers returns the neutral baseline."""
+        assert get_unity_coefficient("The quick brown fox jumps over the lazy dog.") == 0.5
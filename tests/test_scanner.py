@@ -0,0 +1,63 @@
+"""
+Tests for the single-pass keyword scanner.
+
+These tests verify that compiling a lexicon into one pattern finds exactly
+the keywords that individual substring checks would find.
+"""
+
+import pytest
+from love_is_the_key.scanner import KeywordScanner
+from love_is_the_key.context import ContextDetector
+
+
+class TestKeywordScanner:
+    """Test the KeywordScanner presence semantics."""
+    
+    def test_finds_overlapping_keywords(self):
+        """Test that keywords inside or overlapping other keywords are found."""
+        scanner = KeywordScanner(["art", "artistic", "tic", "is"])
+        
+        assert scanner.present("artistic") == {"art", "artistic", "tic", "is"}
+    
+    def test_no_keywords_present(self):
+        """Test that unrelated text yields no keywords."""
+        scanner = KeywordScanner(["love", "unity"])
+        
+        assert scanner.present("The quick brown fox jumps over the lazy dog.") == set()
+        assert scanner.present("") == set()
+    
+    def test_special_characters_are_literal(self):
+        """Test that regex metacharacters in keywords are matched literally."""
+        scanner = KeywordScanner(["peer-reviewed", "a.b", "-dash", "]x", "^y"])
+        
+        assert scanner.present("a peer-reviewed study") == {"peer-reviewed"}
+        assert scanner.present("axb") == set()
+        assert scanner.present("a -dash, ]x and ^y") == {"-dash", "]x", "^y"}
+    
+    def test_matches_substring_semantics(self):
+        """Test agreement with `keyword in text` for the detector lexicons."""
+        keywords = list(ContextDetector._INDICATOR_SLOTS)
+        scanner = KeywordScanner(keywords)
+        text = (
+            "Chapter one: the haunted narrator laughs at the monster's parody "
+            "of research methodology, an artistic metaphor for debugging code."
+        ).lower()
+        
+        assert scanner.present(text) == {k for k in keywords if k in text}
+    
+    def test_count_longest_does_not_overlap(self):
+        """Test that leftmost-longest counting lets each character count once."""
+        scanner = KeywordScanner(["possible", "impossible", "end", "endless", "less"])
+        
+        assert scanner.count_longest("impossible, endless, possible") == {
+            "impossible": 1,
+            "endless": 1,
+            "possible": 1,
+        }
+    
+    def test_empty_lexicon_rejected(self):
+        """Test that a scanner cannot be built without keywords."""
+        with pytest.raises(ValueError):
+            KeywordScanner([])
+        with pytest.raises(ValueError):
+            KeywordScanner(["love", ""])